@@ -6,11 +6,16 @@ Script to update media files (images and videos) with EXIF metadata from JSON fi
 import os
 import sys
 import json
+import atexit
+import logging
 import argparse
+import threading
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, Iterable, Iterator, Optional, Tuple
 import subprocess
-from datetime import datetime
+import time
+from functools import lru_cache
 import shutil
 
 try:
@@ -21,60 +26,142 @@ except ImportError:
     print("pip install Pillow piexif")
     sys.exit(1)
 
+# orjson is optional, it only makes parsing the JSON files faster
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# numba is optional, it compiles the numeric helpers to native code
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+logger = logging.getLogger(__name__)
 
-# Supported file extensions
-IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif'}
-VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.m4v'}
+# piexif tag ids, looked up once instead of on every image
+_T_DATETIME = piexif.ImageIFD.DateTime
+_T_XPTITLE = piexif.ImageIFD.XPTitle
+_T_DESCRIPTION = piexif.ImageIFD.ImageDescription
+_T_XPCOMMENT = piexif.ImageIFD.XPComment
+_T_DTO = piexif.ExifIFD.DateTimeOriginal
+_T_DTD = piexif.ExifIFD.DateTimeDigitized
+_T_GPS_LAT_REF = piexif.GPSIFD.GPSLatitudeRef
+_T_GPS_LAT = piexif.GPSIFD.GPSLatitude
+_T_GPS_LON_REF = piexif.GPSIFD.GPSLongitudeRef
+_T_GPS_LON = piexif.GPSIFD.GPSLongitude
+
+
+# Supported file extensions, lowercase and without the leading dot
+IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'tiff', 'tif'})
+VIDEO_EXTENSIONS = frozenset({'mp4', 'mov', 'avi', 'mkv', 'm4v'})
 ALL_MEDIA_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
+# Images whose EXIF can be replaced without re-encoding
+JPEG_EXTENSIONS = frozenset({'jpg', 'jpeg'})
+
+# Encoder quality for images Pillow has to re-encode
+DEFAULT_QUALITY = 95
+
+# Sidecar names tried after the full media file name, in order
+JSON_SUFFIXES = ('.suppl.json', '.supplemental-metadata.json', '.json')
+
+# How many files main keeps queued per worker while the scan is still running
+IN_FLIGHT_PER_WORKER = 4
 
 
-def find_media_files(folder: Path) -> List[Path]:
+def find_json_name(name: str, names: AbstractSet[str]) -> Optional[str]:
     """
-    Recursively find all media files in the given folder.
+    Find the name of the JSON file for a media file among a directory's names.
     
     Args:
-        folder: Path to the folder to scan
+        name: File name of the media file
+        names: Names of all entries in the media file's directory
         
     Returns:
-        List of Path objects for media files
+        Name of the JSON file if found, None otherwise
     """
-    media_files = []
-    for root, _, files in os.walk(folder):
-        for file in files:
-            file_path = Path(root) / file
-            if file_path.suffix.lower() in ALL_MEDIA_EXTENSIONS:
-                media_files.append(file_path)
-    return media_files
+    for json_suffix in JSON_SUFFIXES:
+        json_name = name + json_suffix
+        if json_name in names:
+            return json_name
+
+    # Also try without the original extension (e.g., file.json instead of file.jpg.json)
+    json_name_alt = name.rpartition('.')[0] + '.json'
+    if json_name_alt in names:
+        return json_name_alt
+    
+    return None
 
 
-def find_json_file(media_file: Path) -> Optional[Path]:
+def _scan(path: str) -> Iterator[Tuple[str, Optional[str]]]:
     """
-    Find the corresponding JSON file for a media file.
+    Recursively yield the media files below the given directory with their JSON files.
+    
+    Each directory is listed once and its names are reused to find the JSON
+    files, instead of probing the filesystem for every candidate name.
     
     Args:
-        media_file: Path to the media file
+        path: Directory to scan
         
     Returns:
-        Path to JSON file if found, None otherwise
+        Iterator over (media file path, JSON file path or None) string pairs
     """
-    json_file = media_file.with_suffix(media_file.suffix + '.suppl.json')
-    if json_file.exists():
-        return json_file
-    
-    json_file = media_file.with_suffix(media_file.suffix + '.supplemental-metadata.json')
-    if json_file.exists():
-        return json_file
+    names = set()
+    media_names = []
+    subdirs = []
+    try:
+        it = os.scandir(path)
+    except OSError as e:
+        print(f"Warning: skipping unreadable directory {path}: {e}")
+        return
     
-    json_file = media_file.with_suffix(media_file.suffix + '.json')
-    if json_file.exists():
-        return json_file
+    with it:
+        for entry in it:
+            names.add(entry.name)
+            # Like os.walk: don't descend into symlinked directories,
+            # but do pick up symlinked files
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                is_file = entry.is_file()
+            except OSError:
+                # e.g. a symlink loop; skip just this entry
+                continue
+            if is_file:
+                stem, dot, ext = entry.name.rpartition('.')
+                if stem and dot and ext.lower() in ALL_MEDIA_EXTENSIONS:
+                    media_names.append(entry.name)
+    
+    for name in media_names:
+        json_name = find_json_name(name, names)
+        json_path = os.path.join(path, json_name) if json_name is not None else None
+        yield os.path.join(path, name), json_path
+    
+    for subdir in subdirs:
+        yield from _scan(subdir)
 
-    # Also try without the original extension (e.g., file.json instead of file.jpg.json)
-    json_file_alt = media_file.with_suffix('.json')
-    if json_file_alt.exists():
-        return json_file_alt
+
+def find_media_files(folder: Path) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Recursively find all media files in the given folder, with their JSON files.
     
-    return None
+    Files are yielded a directory at a time as they are found, so callers can
+    start processing before the whole tree has been scanned.
+    
+    Args:
+        folder: Path to the folder to scan
+        
+    Returns:
+        Iterator over (media file path, JSON file path or None) string pairs
+    """
+    return _scan(str(folder))
 
 
 def load_json_metadata(json_file: Path) -> Optional[Dict]:
@@ -88,13 +175,19 @@ def load_json_metadata(json_file: Path) -> Optional[Dict]:
         Dictionary containing metadata, or None if error
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(json_file, 'rb') as f:
+            return _loads(f.read())
     except Exception as e:
         print(f"Error loading {json_file}: {e}")
         return None
 
 
+@lru_cache(maxsize=4096)
+def _format_exif_timestamp(timestamp: int) -> str:
+    """Format a Unix timestamp as an EXIF datetime, cached since burst shots share timestamps."""
+    return time.strftime("%Y:%m:%d %H:%M:%S", time.localtime(timestamp))
+
+
 def convert_timestamp_to_exif(timestamp: int) -> str:
     """
     Convert Unix timestamp to EXIF datetime format (YYYY:MM:DD HH:MM:SS).
@@ -105,15 +198,14 @@ def convert_timestamp_to_exif(timestamp: int) -> str:
     Returns:
         Date string in EXIF format
     """
-    # check if timestamp is int or str
-    if isinstance(timestamp, str):
+    # Takeout stores timestamps as strings
+    if type(timestamp) is not int:
         timestamp = int(timestamp)
-
-    dt = datetime.fromtimestamp(timestamp)
-    return dt.strftime("%Y:%m:%d %H:%M:%S")
+    return _format_exif_timestamp(timestamp)
 
 
-def update_image_exif(image_file: Path, output_file: Path, metadata: Dict) -> bool:
+def update_image_exif(image_file: Path, output_file: Path, metadata: Dict,
+                      overwrite_exif: bool = False, quality: int = DEFAULT_QUALITY) -> bool:
     """
     Update EXIF metadata for an image file using piexif.
     
@@ -121,16 +213,23 @@ def update_image_exif(image_file: Path, output_file: Path, metadata: Dict) -> bo
         image_file: Path to the source image file
         output_file: Path to save the updated image file
         metadata: Dictionary containing EXIF metadata
+        overwrite_exif: If True, start from empty EXIF instead of merging into the existing one
+        quality: Encoder quality, used when Pillow has to re-encode lossy image data
         
     Returns:
         True if successful, False otherwise
     """
+    debug = logger.isEnabledFor(logging.DEBUG)
     try:
-        # Load existing EXIF data
-        try:
-            exif_dict = piexif.load(str(image_file))
-        except Exception:
-            # If no EXIF data exists, create empty structure
+        exif_dict = None
+        if not overwrite_exif:
+            # Load existing EXIF data
+            try:
+                exif_dict = piexif.load(str(image_file))
+            except Exception:
+                pass
+        if exif_dict is None:
+            # Overwriting, or no EXIF data exists: create empty structure
             exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}}
         
         # Update EXIF data from metadata
@@ -138,24 +237,27 @@ def update_image_exif(image_file: Path, output_file: Path, metadata: Dict) -> bo
         if 'photoTakenTime' in metadata :
             timestamp = metadata.get('photoTakenTime', {}).get('timestamp')
             if timestamp is not None:
-                print (f"Setting DateTime EXIF data: {timestamp}")
                 date_time = convert_timestamp_to_exif(timestamp)
-                print (f"Setting DateTime EXIF data: {date_time} (from timestamp: {timestamp})")
-                exif_dict['0th'][piexif.ImageIFD.DateTime] = date_time.encode('utf-8')
-                exif_dict['Exif'][piexif.ExifIFD.DateTimeOriginal] = date_time.encode('utf-8')
-                exif_dict['Exif'][piexif.ExifIFD.DateTimeDigitized] = date_time.encode('utf-8')
+                if debug:
+                    logger.debug("Setting DateTime EXIF data: %s (from timestamp: %s)", date_time, timestamp)
+                date_time_bytes = date_time.encode('utf-8')
+                exif_dict['0th'][_T_DATETIME] = date_time_bytes
+                exif_dict['Exif'][_T_DTO] = date_time_bytes
+                exif_dict['Exif'][_T_DTD] = date_time_bytes
             
         if 'title' in metadata or 'Title' in metadata:
             title = metadata.get('title') or metadata.get('Title')
             if title is not None:
-                print (f"Setting XPTitle EXIF data: {title}")
-                exif_dict['0th'][piexif.ImageIFD.XPTitle] = title.encode('utf-16le')
+                if debug:
+                    logger.debug("Setting XPTitle EXIF data: %s", title)
+                exif_dict['0th'][_T_XPTITLE] = title.encode('utf-16le')
 
         if 'description' in metadata or 'Description' in metadata:
             desc = metadata.get('description') or metadata.get('Description')
             if desc is not None:
-                print (f"Setting ImageDescription EXIF data: {desc}")
-                exif_dict['0th'][piexif.ImageIFD.ImageDescription] = desc.encode('utf-8')
+                if debug:
+                    logger.debug("Setting ImageDescription EXIF data: %s", desc)
+                exif_dict['0th'][_T_DESCRIPTION] = desc.encode('utf-8')
         
         if 'people' in metadata:
             people = metadata['people']
@@ -163,8 +265,9 @@ def update_image_exif(image_file: Path, output_file: Path, metadata: Dict) -> bo
                 # extract the names
                 people_names = [p.get('name') for p in people if 'name' in p]
                 people_str = ', '.join(people_names)
-                print(f"Setting XPComment EXIF data: {people_str}")
-                exif_dict['0th'][piexif.ImageIFD.XPComment] = people_str.encode('utf-16le')
+                if debug:
+                    logger.debug("Setting XPComment EXIF data: %s", people_str)
+                exif_dict['0th'][_T_XPCOMMENT] = people_str.encode('utf-16le')
         
         # GPS data
         if 'geoData' in metadata:
@@ -174,7 +277,8 @@ def update_image_exif(image_file: Path, output_file: Path, metadata: Dict) -> bo
                     lat = geo['latitude']
                     lon = geo['longitude']
                     if lat is not None and lon is not None:
-                        print(f"Setting GPS EXIF data: lat={lat}, lon={lon}")
+                        if debug:
+                            logger.debug("Setting GPS EXIF data: lat=%s, lon=%s", lat, lon)
                         exif_dict['GPS'] = create_gps_exif(lat, lon)
             
         # Convert EXIF dict to bytes
@@ -184,8 +288,14 @@ def update_image_exif(image_file: Path, output_file: Path, metadata: Dict) -> bo
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Save image with new EXIF data to output file
-        img = Image.open(image_file)
-        img.save(str(output_file), exif=exif_bytes, quality=95)
+        if image_file.name.rpartition('.')[2].lower() in JPEG_EXTENSIONS:
+            # Only the APP1 segment is rewritten, the image data is copied as-is
+            shutil.copy2(image_file, output_file)
+            piexif.insert(exif_bytes, str(output_file))
+        else:
+            img = Image.open(image_file)
+            img.save(str(output_file), exif=exif_bytes, quality=quality,
+                     optimize=False, progressive=False, subsampling='4:2:0')
         
         return True
     except Exception as e:
@@ -193,6 +303,16 @@ def update_image_exif(image_file: Path, output_file: Path, metadata: Dict) -> bo
         return False
 
 
+@njit(cache=True)
+def to_degrees(value: float) -> tuple:
+    """Convert decimal degrees to degrees, minutes, seconds."""
+    value = abs(value)
+    degrees = int(value)
+    minutes = int((value - degrees) * 60)
+    seconds = (value - degrees - minutes / 60) * 3600
+    return ((degrees, 1), (minutes, 1), (int(seconds * 100), 100))
+
+
 def create_gps_exif(lat: float, lon: float) -> Dict:
     """
     Create GPS EXIF data from latitude and longitude.
@@ -204,37 +324,211 @@ def create_gps_exif(lat: float, lon: float) -> Dict:
     Returns:
         Dictionary with GPS EXIF data
     """
-    def to_degrees(value: float) -> tuple:
-        """Convert decimal degrees to degrees, minutes, seconds."""
-        value = abs(value)
-        degrees = int(value)
-        minutes = int((value - degrees) * 60)
-        seconds = (value - degrees - minutes / 60) * 3600
-        return ((degrees, 1), (minutes, 1), (int(seconds * 100), 100))
-    
     gps_ifd = {
-        piexif.GPSIFD.GPSLatitudeRef: 'N' if lat >= 0 else 'S',
-        piexif.GPSIFD.GPSLatitude: to_degrees(lat),
-        piexif.GPSIFD.GPSLongitudeRef: 'E' if lon >= 0 else 'W',
-        piexif.GPSIFD.GPSLongitude: to_degrees(lon),
+        _T_GPS_LAT_REF: 'N' if lat >= 0 else 'S',
+        _T_GPS_LAT: to_degrees(float(lat)),
+        _T_GPS_LON_REF: 'E' if lon >= 0 else 'W',
+        _T_GPS_LON: to_degrees(float(lon)),
     }
     return gps_ifd
 
 
+@lru_cache(maxsize=1)
 def check_exiftool_installed() -> bool:
     """
     Check if exiftool is installed on the system.
     
+    The result is cached, so exiftool is only run once per process.
+    
     Returns:
         True if exiftool is available, False otherwise
     """
     try:
-        subprocess.run(['exiftool', '-ver'], capture_output=True, check=True)
+        subprocess.run(['exiftool', '-ver'], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
+# Video tags written by exiftool: the JSON keys they are read from, first one
+# that is set wins, and the exiftool tags they are written to
+_VIDEO_TAG_SOURCES = (
+    (('dateTime', 'DateTime'), ('CreateDate', 'ModifyDate')),
+    (('description', 'Description'), ('Description',)),
+    (('make', 'Make'), ('Make',)),
+    (('model', 'Model'), ('Model',)),
+)
+_VIDEO_GPS_KEYS = frozenset({'gpsLatitude', 'gpsLongitude'})
+_KNOWN_VIDEO_KEYS = frozenset(
+    key for keys, _ in _VIDEO_TAG_SOURCES for key in keys
+) | _VIDEO_GPS_KEYS
+
+
+def _argfile_line(arg: str) -> str:
+    """
+    Format one argument as an argfile line.
+    
+    exiftool trims ordinary argfile lines and ends them at newlines, so
+    arguments with surrounding whitespace or line breaks use the escaped
+    #[CSTR] form instead.
+    
+    >>> _argfile_line('-Make=Canon')
+    '-Make=Canon\\n'
+    >>> print(_argfile_line('-Description=line 1\\nC:\\\\dir'), end='')
+    #[CSTR]-Description=line 1\\nC:\\\\dir
+    >>> _argfile_line('-Description= padded ')
+    '#[CSTR]-Description= padded \\n'
+    """
+    if arg != arg.strip() or '\n' in arg or '\r' in arg:
+        escaped = arg.replace('\\', '\\\\').replace('\n', '\\n').replace('\r', '\\r')
+        return f'#[CSTR]{escaped}\n'
+    return f'{arg}\n'
+
+
+def build_argfile(path: Path, metadata: Dict) -> bytes:
+    """
+    Build the exiftool argfile that writes a video's metadata in place.
+    
+    Args:
+        path: Path to the file to update
+        metadata: Dictionary containing EXIF metadata
+        
+    Returns:
+        Argfile contents, ending with -execute
+    
+    >>> print(build_argfile(Path('/videos/clip.mp4'), {
+    ...     'Description': 'Beach\\nday', 'make': 'Sony', 'gpsLatitude': 1.5, 'gpsLongitude': 2.5,
+    ... }).decode('utf-8'), end='')
+    -overwrite_original
+    #[CSTR]-Description=Beach\\nday
+    -Make=Sony
+    -GPSLatitude=1.5
+    -GPSLongitude=2.5
+    /videos/clip.mp4
+    -execute
+    >>> build_argfile(Path('/videos/clip.mp4'), {'gpsLatitude': 1.5})
+    b'-overwrite_original\\n/videos/clip.mp4\\n-execute\\n'
+    """
+    # Check for all the keys we use at once; most JSON files only have a few of them
+    present = metadata.keys() & _KNOWN_VIDEO_KEYS
+    
+    lines = ['-overwrite_original\n']
+    if present:
+        for keys, tags in _VIDEO_TAG_SOURCES:
+            if not present.isdisjoint(keys):
+                value = metadata.get(keys[0]) or metadata.get(keys[1])
+                lines.extend(_argfile_line(f'-{tag}={value}') for tag in tags)
+        if _VIDEO_GPS_KEYS <= present:
+            lines.append(_argfile_line(f"-GPSLatitude={metadata['gpsLatitude']}"))
+            lines.append(_argfile_line(f"-GPSLongitude={metadata['gpsLongitude']}"))
+    lines.append(_argfile_line(str(path)))
+    lines.append('-execute\n')
+    return ''.join(lines).encode('utf-8')
+
+
+class ExifToolDaemon:
+    """
+    A single long-lived exiftool process driven through -stay_open.
+    
+    Starting exiftool means starting a Perl interpreter, which costs far more
+    than writing a handful of tags, so the process is started on first use
+    and every video is written through it. Commands are serialized, so
+    threads should each use their own daemon (see get_daemon).
+    """
+    
+    READY = b'{ready}'
+    
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+    
+    def _start(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ['exiftool', '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+    
+    def execute(self, argfile: bytes) -> Tuple[bool, str]:
+        """
+        Run one exiftool command.
+        
+        Args:
+            argfile: Arguments in argfile format, ending with -execute (see build_argfile)
+            
+        Returns:
+            Tuple of (success, exiftool output)
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._process = self._start()
+            self._process.stdin.write(argfile)
+            self._process.stdin.flush()
+            
+            lines = []
+            while True:
+                line = self._process.stdout.readline()
+                if not line:
+                    raise RuntimeError("exiftool exited unexpectedly")
+                if line.rstrip() == self.READY:
+                    break
+                lines.append(line)
+        
+        output = b''.join(lines).decode('utf-8', errors='replace').strip()
+        success = not any(line.startswith('Error') for line in output.splitlines())
+        return success, output
+    
+    def close(self):
+        """Ask exiftool to exit and wait for it."""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                return
+            try:
+                self._process.stdin.write(b'-stay_open\nFalse\n')
+                self._process.stdin.flush()
+                self._process.stdin.close()
+            except OSError:
+                pass
+            self._process.wait()
+            self._process = None
+
+
+# One daemon per worker thread, so videos are written concurrently with --threads.
+# Worker processes that skip atexit still release theirs, since exiftool exits
+# on its own once stdin is closed.
+_thread_daemons = threading.local()
+_all_daemons = []
+_all_daemons_lock = threading.Lock()
+
+
+def get_daemon() -> ExifToolDaemon:
+    """
+    Get the calling thread's exiftool daemon, creating it on first use.
+    
+    Returns:
+        The ExifToolDaemon owned by the current thread
+    """
+    daemon = getattr(_thread_daemons, 'daemon', None)
+    if daemon is None:
+        daemon = ExifToolDaemon()
+        _thread_daemons.daemon = daemon
+        with _all_daemons_lock:
+            _all_daemons.append(daemon)
+    return daemon
+
+
+@atexit.register
+def close_daemons():
+    """Shut down every exiftool daemon started by this process."""
+    with _all_daemons_lock:
+        daemons = list(_all_daemons)
+        _all_daemons.clear()
+    for daemon in daemons:
+        daemon.close()
+
+
 def update_video_exif(video_file: Path, output_file: Path, metadata: Dict) -> bool:
     """
     Update EXIF metadata for a video file using exiftool.
@@ -248,51 +542,38 @@ def update_video_exif(video_file: Path, output_file: Path, metadata: Dict) -> bo
         True if successful, False otherwise
     """
     if not check_exiftool_installed():
-        print("Warning: exiftool not installed. Skipping video file.")
-        print("Install exiftool: brew install exiftool (macOS) or apt-get install exiftool (Linux)")
+        print(f"Skipping video, exiftool not installed: {video_file}")
         return False
     
+    # Parse the capture time up front, so a bad value can't fail an otherwise good write
+    taken_time = None
+    photo_taken = metadata.get('photoTakenTime') if isinstance(metadata, dict) else None
+    if isinstance(photo_taken, dict) and photo_taken.get('timestamp') is not None:
+        try:
+            taken_time = int(photo_taken['timestamp'])
+        except (TypeError, ValueError, OverflowError):
+            print(f"Warning: ignoring invalid photoTakenTime for {video_file}: {photo_taken['timestamp']!r}")
+    
     try:
         # Create output directory if it doesn't exist
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Copy the file first
-        shutil.copy2(video_file, output_file)
-        
-        # Build exiftool command
-        cmd = ['exiftool', '-overwrite_original']
-        
-        # Add metadata tags
-        if 'dateTime' in metadata or 'DateTime' in metadata:
-            date_time = metadata.get('dateTime') or metadata.get('DateTime')
-            cmd.extend([f'-CreateDate={date_time}', f'-ModifyDate={date_time}'])
-        
-        if 'description' in metadata or 'Description' in metadata:
-            desc = metadata.get('description') or metadata.get('Description')
-            cmd.append(f'-Description={desc}')
-        
-        if 'make' in metadata or 'Make' in metadata:
-            make = metadata.get('make') or metadata.get('Make')
-            cmd.append(f'-Make={make}')
-        
-        if 'model' in metadata or 'Model' in metadata:
-            model = metadata.get('model') or metadata.get('Model')
-            cmd.append(f'-Model={model}')
-        
-        if 'gpsLatitude' in metadata and 'gpsLongitude' in metadata:
-            lat = metadata['gpsLatitude']
-            lon = metadata['gpsLongitude']
-            cmd.extend([f'-GPSLatitude={lat}', f'-GPSLongitude={lon}'])
-        
-        cmd.append(str(output_file))
+        # Copy the file first; exiftool rewrites it anyway, so there is no point preserving stat info
+        shutil.copyfile(str(video_file), str(output_file))
         
         # Execute exiftool
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        success, output = get_daemon().execute(build_argfile(output_file, metadata))
         
-        if result.returncode == 0:
+        if success:
+            # Date the file by when the video was taken
+            if taken_time is not None:
+                try:
+                    os.utime(output_file, (taken_time, taken_time))
+                except (OSError, OverflowError) as e:
+                    print(f"Warning: could not set file times for {output_file}: {e}")
             return True
         else:
-            print(f"exiftool error for {video_file}: {result.stderr}")
+            print(f"exiftool error for {video_file}: {output}")
             return False
             
     except Exception as e:
@@ -300,25 +581,27 @@ def update_video_exif(video_file: Path, output_file: Path, metadata: Dict) -> bo
         return False
 
 
-def process_media_file(media_file: Path, source_folder: Path, output_folder: Path, dry_run: bool = False) -> bool:
+def process_media_file(media_file: Path, source_folder: Path, output_folder: Path,
+                       json_file: Path, dry_run: bool = False, overwrite_exif: bool = False,
+                       quality: int = DEFAULT_QUALITY) -> bool:
     """
-    Process a single media file: find JSON, load metadata, update file.
+    Process a single media file: load metadata from its JSON file, update file.
+    
+    Runs inside a worker of the executor created by main.
     
     Args:
         media_file: Path to the media file
         source_folder: The original source folder
         output_folder: The output folder for updated files
+        json_file: Path to the media file's JSON file, as found by find_media_files
         dry_run: If True, only show what would be done
+        overwrite_exif: If True, discard the images' existing EXIF instead of merging into it
+        quality: Encoder quality for images that have to be re-encoded
         
     Returns:
-        True if successful or skipped, False if error
+        True if successful, False if error
     """
-    # Find corresponding JSON file
-    json_file = find_json_file(media_file)
-    
-    if json_file is None:
-        print(f"⊘ No JSON found for: {media_file}")
-        return True  # Not an error, just skip
+    extension = media_file.name.rpartition('.')[2].lower()
     
     # Load metadata
     metadata = load_json_metadata(json_file)
@@ -334,23 +617,120 @@ def process_media_file(media_file: Path, source_folder: Path, output_folder: Pat
         return True
     
     # Update based on file type
-    is_image = media_file.suffix.lower() in IMAGE_EXTENSIONS
-    is_video = media_file.suffix.lower() in VIDEO_EXTENSIONS
+    is_image = extension in IMAGE_EXTENSIONS
+    is_video = extension in VIDEO_EXTENSIONS
     
     if is_image:
-        success = update_image_exif(media_file, output_file, metadata)
+        success = update_image_exif(media_file, output_file, metadata, overwrite_exif, quality)
         if success:
-            print(f"✓ Updated image: {media_file} -> {output_file}")
+            logger.info("✓ Updated image: %s -> %s", media_file, output_file)
         return success
     elif is_video:
         success = update_video_exif(media_file, output_file, metadata)
         if success:
-            print(f"✓ Updated video: {media_file} -> {output_file}")
+            logger.info("✓ Updated video: %s -> %s", media_file, output_file)
         return success
     
     return False
 
 
+def positive_int(value: str) -> int:
+    """
+    argparse type for options that must be a positive integer.
+    
+    Args:
+        value: The option's value from the command line
+        
+    Returns:
+        The value as an int
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def quality_int(value: str) -> int:
+    """
+    argparse type for encoder quality, which Pillow accepts from 1 to 100.
+    
+    Args:
+        value: The option's value from the command line
+        
+    Returns:
+        The value as an int
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if not 1 <= number <= 100:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 100, got {number}")
+    return number
+
+
+def configure_logging(verbose: bool):
+    """
+    Set up logging for the main process and for each worker.
+    
+    Args:
+        verbose: If True, log every updated file and every tag written
+    """
+    # Only this script's logger, so Pillow's and numba's debug logging stays quiet
+    logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+
+
+def init_worker(verbose: bool):
+    """
+    Prepare an executor worker: set up logging and compile the numba helpers.
+    
+    Args:
+        verbose: Passed on to configure_logging
+    """
+    configure_logging(verbose)
+    # Trigger (or load the cached) compilation now rather than on the first image
+    to_degrees(0.0)
+
+
+def count_results(done: Iterable[Future], pending: Dict[Future, Path]) -> Tuple[int, int]:
+    """
+    Count the outcomes of finished process_media_file futures.
+    
+    A worker that raised (or died) counts as a failed file rather than
+    stopping the run.
+    
+    Args:
+        done: Completed futures
+        pending: Mapping of submitted futures to their media files; the
+            completed ones are removed from it
+        
+    Returns:
+        Tuple of (successful, failed) counts
+    """
+    successes = 0
+    errors = 0
+    for future in done:
+        media_file = pending.pop(future)
+        try:
+            success = future.result()
+        except Exception as e:
+            print(f"Error processing {media_file}: {e!r}")
+            success = False
+        if success:
+            successes += 1
+        else:
+            errors += 1
+    return successes, errors
+
+
 def main():
     """Main function to run the script."""
     parser = argparse.ArgumentParser(
@@ -372,8 +752,40 @@ def main():
         default='-exif',
         help='Suffix to append to the output folder name (default: -exif)'
     )
+    parser.add_argument(
+        '--overwrite-exif',
+        action='store_true',
+        help='Discard the images\' existing EXIF data (orientation, camera, exposure, GPS...) '
+             'instead of merging the JSON metadata into it; skips reading it, which is '
+             'faster for images that have no EXIF worth keeping'
+    )
+    parser.add_argument(
+        '--quality',
+        type=quality_int,
+        default=DEFAULT_QUALITY,
+        help='Encoder quality (1-100) for images that have to be re-encoded, such as '
+             f'JPEG-compressed TIFFs; JPEGs are never re-encoded (default: {DEFAULT_QUALITY})'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Print every updated file and the EXIF tags written to it'
+    )
+    parser.add_argument(
+        '--workers',
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help='Number of files to process in parallel (default: number of CPUs)'
+    )
+    parser.add_argument(
+        '--threads',
+        action='store_true',
+        help='Use worker threads instead of processes (cheaper for video-heavy folders, '
+             'where the time is spent waiting on exiftool)'
+    )
     
     args = parser.parse_args()
+    configure_logging(args.verbose)
     
     folder = Path(args.folder).resolve()
     
@@ -390,36 +802,67 @@ def main():
     
     print(f"Scanning folder: {folder}")
     print(f"Output folder: {output_folder}")
+    if not args.dry_run and not check_exiftool_installed():
+        print("Warning: exiftool not installed. Video files will not be updated.")
+        print("Install exiftool: brew install exiftool (macOS) or apt-get install exiftool (Linux)")
     print("-" * 60)
     
-    # Find all media files
-    media_files = find_media_files(folder)
-    
-    if not media_files:
-        print("No media files found.")
-        return
-    
-    print(f"Found {len(media_files)} media file(s)")
-    print("-" * 60)
-    
-    # Process each file
+    # Process each file as the scan finds it
     success_count = 0
     skipped_count = 0
     error_count = 0
     
-    for media_file in media_files:
-        json_file = find_json_file(media_file)
-        if json_file is None:
-            skipped_count += 1
-        else:
-            success = process_media_file(media_file, folder, output_folder, dry_run=args.dry_run)
-            if success:
-                success_count += 1
-            else:
-                error_count += 1
+    # Bound the number of submitted files so memory stays flat on large folders
+    max_in_flight = args.workers * IN_FLIGHT_PER_WORKER
+    
+    executor_class = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
+    
+    def make_executor():
+        return executor_class(max_workers=args.workers, initializer=init_worker,
+                              initargs=(args.verbose,))
+    
+    executor = make_executor()
+    try:
+        pending = {}
+        for path, json_path in find_media_files(folder):
+            if json_path is None:
+                skipped_count += 1
+                continue
+            media_file = Path(path)
+            json_file = Path(json_path)
+            
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                successes, errors = count_results(done, pending)
+                success_count += successes
+                error_count += errors
+            
+            task = (process_media_file, media_file, folder, output_folder, json_file,
+                    args.dry_run, args.overwrite_exif, args.quality)
+            try:
+                future = executor.submit(*task)
+            except BrokenExecutor:
+                # A worker died (e.g. killed by the OS); its files are counted as
+                # errors, carry on with a fresh pool
+                print("Warning: a worker stopped unexpectedly, restarting the worker pool")
+                executor.shutdown(wait=False)
+                executor = make_executor()
+                future = executor.submit(*task)
+            pending[future] = media_file
+        
+        successes, errors = count_results(wait(pending).done, pending)
+        success_count += successes
+        error_count += errors
+    finally:
+        executor.shutdown()
+    
+    if success_count + skipped_count + error_count == 0:
+        print("No media files found.")
+        return
     
     print("-" * 60)
     print(f"Summary:")
+    print(f"  Media files found: {success_count + skipped_count + error_count}")
     print(f"  Updated: {success_count}")
     print(f"  Skipped (no JSON): {skipped_count}")
     print(f"  Errors: {error_count}")